@@ -10,15 +10,22 @@ logger = logging.getLogger(__name__)
 class AutoCommitter:
     """GitHub 커밋 자동화 클래스"""
     
-    def __init__(self, schedule_input, repo_path=None):
+    def __init__(self, schedule_input, repo_path=None, target_pixels=None, start_date=None):
         """
         Initialize AutoCommitter
         
         Args:
             schedule_input: 스케줄 파일 경로(str/Path) 또는 스케줄 리스트
             repo_path: Git 저장소 경로 (선택적)
+            target_pixels: 커밋 후 검증할 목표 픽셀 그리드 (선택적)
+            start_date: 스케줄 시작 날짜 (target_pixels 지정 시 필수)
         """
+        if target_pixels is not None and start_date is None:
+            raise ValueError("start_date is required to verify target_pixels")
+
         self.repo_path = Path(repo_path) if repo_path else None
+        self.target_pixels = target_pixels
+        self.start_date = start_date
         
         # 스케줄 로드
         if isinstance(schedule_input, (str, Path)):
@@ -95,11 +102,36 @@ class AutoCommitter:
             finally:
                 # 원래 디렉토리로 복귀
                 os.chdir(original_dir)
+
+            # 커밋 결과가 목표 그림과 일치하는지 확인 (검증 실패는 경고로만 처리)
+            if self.target_pixels is not None:
+                try:
+                    if not self.verify(self.target_pixels, self.start_date):
+                        logger.warning("Committed history does not match the target grid")
+                except Exception as e:
+                    logger.warning(f"Verification could not be completed: {e}")
                 
         except Exception as e:
             logger.error(f"Error during commit process: {e}")
             raise
 
+    def verify(self, target_pixels, start_date):
+        """커밋 결과가 목표 픽셀 그리드와 일치하는지 검증
+
+        start_date는 스케줄 생성 시 사용한 시작 날짜여야 함
+        """
+        import numpy as np
+        from .commit_verifier import CommitVerifier
+
+        if not self.repo_path:
+            raise ValueError("Repository path not set")
+        if start_date is None:
+            raise ValueError("start_date is required for verification")
+
+        height, width = np.shape(target_pixels)
+        verifier = CommitVerifier(self.repo_path, start_date, height=height, width=width)
+        return verifier.print_report(target_pixels)
+
     def push(self):
         """변경사항을 원격 저장소에 푸시"""
         try:
@@ -0,0 +1,173 @@
+# commit_verifier.py
+
+import subprocess
+import tempfile
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+import numpy as np
+from .pixel_grid import PixelGrid
+
+logger = logging.getLogger(__name__)
+
+class CommitVerifier:
+    """커밋 후 저장소의 잔디 그리드를 재구성하여 목표 픽셀과 비교하는 클래스"""
+
+    def __init__(self, repo_path, start_date, height=7, width=52):
+        """
+        Initialize CommitVerifier
+
+        Args:
+            repo_path: Git 저장소 경로
+            start_date: 스케줄 첫 날짜 (ScheduleGenerator.start_date)
+            height: 목표 그리드 높이 (days)
+            width: 목표 그리드 너비 (weeks)
+        """
+        if height > 7:
+            raise ValueError(f"Grid height {height} exceeds the 7 days of a GitHub week")
+
+        self.repo_path = Path(repo_path)
+        self.start_date = datetime(start_date.year, start_date.month, start_date.day)
+        self.height = height
+        self.width = width
+        # GitHub 잔디는 일요일 시작 주 단위 열, 일-토 행으로 그려짐
+        self.calendar_start = self.start_date - timedelta(days=self.weekday_row(self.start_date))
+        # 시작일이 일요일이 아니면 마지막 주가 다음 열로 넘어감
+        last_date = self.start_date + timedelta(days=height * width - 1)
+        self.num_columns = (last_date - self.calendar_start).days // 7 + 1
+        logger.info(f"Initialized CommitVerifier for {self.repo_path} from {self.start_date.date()}")
+
+    @staticmethod
+    def weekday_row(date):
+        """GitHub row for a date (0: Sunday ... 6: Saturday)"""
+        return (date.weekday() + 1) % 7
+
+    def get_date(self, column, row):
+        """Calendar date of a GitHub grid cell"""
+        return self.calendar_start + timedelta(weeks=int(column), days=int(row))
+
+    def count_commits_by_day(self):
+        """Count commits per author day in a single streaming `git log` pass"""
+        since = self.calendar_start - timedelta(days=1)
+        cmd = [
+            'git', 'log', '--no-color',
+            '--format=%ad', '--date=short',
+            f'--since={since.strftime("%Y-%m-%d")}',
+        ]
+        counts = Counter()
+        try:
+            # stderr는 임시 파일로 받아 파이프 버퍼가 차서 멈추는 일을 방지
+            with tempfile.TemporaryFile(mode='w+') as stderr_file:
+                with subprocess.Popen(
+                    cmd,
+                    cwd=self.repo_path,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    text=True,
+                    bufsize=1 << 16,
+                ) as proc:
+                    try:
+                        # 한 줄씩 스트리밍하여 전체 로그를 메모리에 올리지 않음
+                        for line in proc.stdout:
+                            counts[line] += 1
+                    except BaseException:
+                        proc.kill()
+                        raise
+                # Popen 컨텍스트 종료 시 프로세스를 wait 함
+                if proc.returncode != 0:
+                    stderr_file.seek(0)
+                    raise subprocess.CalledProcessError(
+                        proc.returncode, cmd, stderr=stderr_file.read()
+                    )
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Git command failed: {e.stderr.strip() if e.stderr else e}")
+            raise
+
+        logger.info(f"Read {sum(counts.values())} commits over {len(counts)} days")
+        return {line.strip(): count for line, count in counts.items()}
+
+    def build_count_grid(self):
+        """Build the 7 x num_columns per-day commit count grid on GitHub's calendar"""
+        grid = np.zeros((7, self.num_columns), dtype=np.int64)
+        for date_str, count in self.count_commits_by_day().items():
+            date = datetime.strptime(date_str, '%Y-%m-%d')
+            column = (date - self.calendar_start).days // 7
+            if 0 <= column < self.num_columns:
+                grid[self.weekday_row(date), column] += count
+        return grid
+
+    @staticmethod
+    def counts_to_levels(count_grid):
+        """Map commit counts to shade levels 0-4 the way GitHub does (quartiles of the max)"""
+        max_count = count_grid.max()
+        if max_count == 0:
+            return np.zeros_like(count_grid)
+        levels = np.ceil(count_grid * 4 / max_count).astype(count_grid.dtype)
+        return np.clip(levels, 0, 4)
+
+    def verify(self, target_pixels):
+        """Compare the repository grid against target pixels and return mismatched cells
+
+        The target is the picture as it should appear on GitHub: row 0 is Sunday
+        and column 0 is the calendar week containing start_date. Any offset
+        between the committed dates and that calendar shows up as mismatches.
+        """
+        if (isinstance(target_pixels, PixelGrid) and target_pixels.start_date is not None
+                and target_pixels.start_date.date() != self.start_date.date()):
+            raise ValueError(
+                f"Target grid starts on {target_pixels.start_date.date()}, "
+                f"not {self.start_date.date()}"
+            )
+        target = np.asarray(target_pixels)
+        if target.shape != (self.height, self.width):
+            raise ValueError(
+                f"Target shape {target.shape} does not match grid {(self.height, self.width)}"
+            )
+
+        expected = np.zeros((7, self.num_columns), dtype=np.int64)
+        expected[:self.height, :self.width] = target
+
+        count_grid = self.build_count_grid()
+        actual = self.counts_to_levels(count_grid)
+        rows, columns = np.nonzero(actual != expected)
+
+        mismatches = [
+            {
+                'week': int(column),
+                'day': int(row),
+                'date': self.get_date(column, row),
+                'expected': int(expected[row, column]),
+                'actual': int(actual[row, column]),
+                'commits': int(count_grid[row, column]),
+            }
+            for row, column in zip(rows, columns)
+        ]
+        logger.info(f"Verification found {len(mismatches)} mismatched cells")
+        return mismatches
+
+    def format_report(self, mismatches):
+        """Format a cell-level mismatch report"""
+        total = 7 * self.num_columns
+        lines = [
+            "GitHub Grass Art - Verification Report",
+            "=" * 40,
+            f"Matched cells: {total - len(mismatches)}/{total}",
+        ]
+        if mismatches:
+            lines.append("")
+            lines.append("Mismatched cells:")
+            lines.append("-" * 40)
+            for m in sorted(mismatches, key=lambda m: m['date']):
+                lines.append(
+                    f"{m['date'].strftime('%Y-%m-%d (%a)')} "
+                    f"[week {m['week']:2d}, day {m['day']}]: "
+                    f"expected {m['expected']}, got {m['actual']} ({m['commits']} commits)"
+                )
+        return "\n".join(lines)
+
+    def print_report(self, target_pixels):
+        """Verify against target pixels and print the report; returns True if the grid matches"""
+        mismatches = self.verify(target_pixels)
+        print(self.format_report(mismatches))
+        return not mismatches
@@ -6,11 +6,12 @@ import platform
 import os
 import logging
 from scipy.ndimage import gaussian_filter
+from .pixel_grid import PixelGrid
 
 logger = logging.getLogger(__name__)
 
 class ImageProcessor:
-    def __init__(self, input_data, is_text=True, style='simple'):
+    def __init__(self, input_data, is_text=True, style='simple', as_grid=False):
         """
         Initialize ImageProcessor
         
@@ -18,10 +19,12 @@ class ImageProcessor:
             input_data: Text string or image path
             is_text: Boolean indicating if input is text
             style: Rendering style ('simple', 'gradient', 'border')
+            as_grid: Return compact PixelGrid instead of int ndarray
         """
         self.input_data = input_data
         self.is_text = is_text
         self.style = style
+        self.as_grid = as_grid
         self.width = 52  # GitHub contribution graph width (weeks)
         self.height = 7  # GitHub contribution graph height (days)
         logger.info(f"Initialized ImageProcessor with style: {style}")
@@ -75,12 +78,15 @@ class ImageProcessor:
             logger.error(f"Error in text_to_image: {str(e)}")
             raise
 
+    def load_image(self):
+        """Load source image from text or image path"""
+        if self.is_text:
+            return self.text_to_image(self.input_data)
+        return Image.open(self.input_data)
+
     def process_all_styles(self):
         """Generate all style variations and return them"""
-        if self.is_text:
-            image = self.text_to_image(self.input_data)
-        else:
-            image = Image.open(self.input_data)
+        image = self.load_image()
 
         styles = {
             'simple': self.process_style(image, 'simple'),
@@ -125,7 +131,7 @@ class ImageProcessor:
             img_array = np.array(image)
             
             # Create empty pixel array
-            pixels = np.zeros((self.height, self.width), dtype=float)
+            pixels = np.zeros((self.height, self.width), dtype=np.uint8)
             
             # Calculate centering offsets
             x_offset = (self.width - target_width) // 2
@@ -186,6 +192,8 @@ class ImageProcessor:
             ] = processed
             
             logger.info(f"Final pixel array shape: {pixels.shape}")
+            if self.as_grid:
+                return PixelGrid(pixels)
             return pixels.astype(int)
             
         except Exception as e:
@@ -6,8 +6,10 @@ from .image_processor import ImageProcessor
 from .preview_generator import PreviewGenerator
 from .schedule_generator import ScheduleGenerator
 from .readme_generator import ReadmeGenerator
+from .commit_verifier import CommitVerifier
 import traceback
 from collections import Counter
+from datetime import datetime
 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,15 +41,35 @@ def parse_arguments():
             args = argparse.Namespace()
             args.input = input_data
             args.is_text = is_text
+            args.serve = False
+            args.verify = None
             return args
         
         # Command line mode
         parser.add_argument('-t', '--text', help='Text to display')
         parser.add_argument('-i', '--image', help='Image file path')
+        parser.add_argument('--serve', action='store_true', help='Run local render service')
+        parser.add_argument('--host', default='127.0.0.1', help='Render service host')
+        parser.add_argument('--port', type=int, default=8765, help='Render service port')
+        parser.add_argument('--socket', help='Serve on Unix socket path instead of TCP')
+        parser.add_argument('--workers', type=int, help='Render worker process count')
+        parser.add_argument('--cache-size', type=int, default=256, help='Render LRU cache size')
+        parser.add_argument('--allow-images', action='store_true',
+                            help='Allow render requests to open server-side image paths')
+        parser.add_argument('--allow-remote', action='store_true',
+                            help='Allow binding the render service to a non-loopback host')
+        parser.add_argument('--verify', metavar='REPO', help='Verify committed repo against the target picture')
+        parser.add_argument('--style', default='simple', choices=['simple', 'gradient', 'border'],
+                            help='Style to verify')
+        parser.add_argument('--start-date', type=lambda s: datetime.strptime(s, '%Y-%m-%d'),
+                            help="Schedule start date (YYYY-MM-DD); use the 'Start date' line in "
+                                 "output/schedules/schedule_<style>.txt, not the first commit date")
         
         args = parser.parse_args()
         args.input = args.text if args.text else args.image
         args.is_text = bool(args.text)
+        if args.verify and not (args.input and args.start_date):
+            parser.error("--verify requires --text or --image and --start-date")
         return args
         
     except Exception as e:
@@ -68,13 +90,15 @@ def show_preview(pixel_data, output_path):
     except Exception as e:
         logger.error(f"Error reading preview file: {e}")
 
-def save_schedule(schedule, output_path):
+def save_schedule(schedule, output_path, start_date):
     """Save commit schedule to file"""
     try:
         with open(output_path, 'w') as f:
             f.write("GitHub Grass Art - Commit Schedule\n")
             f.write("=" * 40 + "\n\n")
             f.write(f"Style: {output_path.stem}\n")
+            # --verify 에 필요한 그리드 시작 날짜 (week 0, day 0)
+            f.write(f"Start date: {start_date.strftime('%Y-%m-%d')}\n")
             f.write(f"Total commits required: {len(schedule)}\n\n")
             
             # Group commits by date
@@ -91,6 +115,13 @@ def save_schedule(schedule, output_path):
         logger.error(f"Error saving schedule: {str(e)}")
         raise
 
+def verify_repo(args):
+    """Verify a committed repository against the target picture"""
+    processor = ImageProcessor(args.input, is_text=args.is_text, style=args.style)
+    verifier = CommitVerifier(args.verify, args.start_date)
+    matched = verifier.print_report(processor.process())
+    return 0 if matched else 1
+
 def setup_output_directory():
     """Set up output directory structure"""
     output_dir = Path("output")
@@ -107,6 +138,22 @@ def setup_output_directory():
 def main():
     try:
         args = parse_arguments()
+
+        if args.serve:
+            from .server import run_server
+            return run_server(
+                host=args.host,
+                port=args.port,
+                socket_path=args.socket,
+                workers=args.workers,
+                cache_size=args.cache_size,
+                allow_images=args.allow_images,
+                allow_remote=args.allow_remote,
+            )
+
+        if args.verify:
+            return verify_repo(args)
+
         logger.info("GitHub Grass Art starting...")
 
         # Set up output directories
@@ -114,7 +161,7 @@ def main():
 
         # 1. Image Processing - generate all styles
         logger.info("Processing image for all styles...")
-        processor = ImageProcessor(args.input, is_text=args.is_text, style='simple')
+        processor = ImageProcessor(args.input, is_text=args.is_text, style='simple', as_grid=True)
         all_styles = processor.process_all_styles()
 
         # 2. Show previews for all styles
@@ -132,7 +179,7 @@ def main():
             scheduler = ScheduleGenerator(pixel_data)
             schedule = scheduler.generate_schedule()
             schedule_file = schedules_dir / f"schedule_{style_name}.txt"
-            save_schedule(schedule, schedule_file)
+            save_schedule(schedule, schedule_file, scheduler.start_date)
             
             print(f"\nPreview saved to: {preview_file}")
             print(f"Schedule saved to: {schedule_file}")
@@ -0,0 +1,114 @@
+# pixel_grid.py
+
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+from datetime import timedelta
+
+MAX_LEVEL = 4
+
+
+class PixelGrid(NDArrayOperatorsMixin):
+    """GitHub 잔디 그리드 (days x weeks) - uint8 강도 레벨과 달력 정보"""
+
+    __slots__ = ('levels', 'start_date')
+
+    def __init__(self, levels, start_date=None):
+        """
+        Initialize PixelGrid
+
+        Args:
+            levels: (days, weeks) 형태의 강도 레벨 배열 (0-4)
+            start_date: (week 0, day 0)에 해당하는 날짜 (선택적, 스케줄 생성 시 결정)
+        """
+        levels = np.asarray(levels)
+        if levels.ndim != 2:
+            raise ValueError(f"Pixel grid must be 2-dimensional, got shape {levels.shape}")
+        if levels.size and (levels.min() < 0 or levels.max() > np.iinfo(np.uint8).max):
+            raise ValueError("Pixel levels must be in range 0-255")
+
+        self.levels = np.ascontiguousarray(levels, dtype=np.uint8)
+        self.start_date = start_date
+
+    @classmethod
+    def coerce(cls, data, start_date=None):
+        """Return data as a PixelGrid, wrapping plain arrays
+
+        An explicit start_date takes precedence; the returned grid shares levels with data.
+        """
+        if isinstance(data, cls):
+            if start_date is None or start_date == data.start_date:
+                return data
+            return cls(data.levels, start_date)
+        return cls(data, start_date)
+
+    @property
+    def shape(self):
+        return self.levels.shape
+
+    @property
+    def height(self):
+        return self.levels.shape[0]
+
+    @property
+    def width(self):
+        return self.levels.shape[1]
+
+    @property
+    def end_date(self):
+        return self.get_date(self.width - 1, self.height - 1)
+
+    def __array__(self, dtype=None, copy=None):
+        dtype = self.levels.dtype if dtype is None else np.dtype(dtype)
+        if copy:
+            return self.levels.astype(dtype, copy=True)
+        if dtype != self.levels.dtype:
+            if copy is False:
+                raise ValueError(f"Cannot convert PixelGrid to {dtype} without a copy")
+            return self.levels.astype(dtype)
+        return self.levels
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # 연산자와 ufunc는 내부 배열에 위임하고 일반 ndarray를 반환
+        inputs = tuple(x.levels if isinstance(x, PixelGrid) else x for x in inputs)
+        if 'out' in kwargs:
+            kwargs['out'] = tuple(x.levels if isinstance(x, PixelGrid) else x for x in kwargs['out'])
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __getitem__(self, index):
+        return self.levels[index]
+
+    def __iter__(self):
+        return iter(self.levels)
+
+    def __len__(self):
+        return self.height
+
+    def __repr__(self):
+        start = f"{self.start_date:%Y-%m-%d}" if self.start_date else None
+        return f"PixelGrid(shape={self.shape}, start_date={start})"
+
+    def tolist(self):
+        return self.levels.tolist()
+
+    def get_date(self, week, day):
+        """Calculate date for given week and day"""
+        if self.start_date is None:
+            raise ValueError("PixelGrid has no start_date")
+        return self.start_date + timedelta(weeks=int(week), days=int(day))
+
+    def week(self, week):
+        """Levels for one week column (view, days 0-6)"""
+        return self.levels[:, week]
+
+    def weeks(self):
+        """Iterate over week columns in calendar order"""
+        return iter(self.levels.T)
+
+    def nonzero_days(self):
+        """(weeks, days) index arrays of non-empty cells in calendar order"""
+        weeks, days = np.nonzero(self.levels.T)
+        return weeks, days
+
+    def level_histogram(self):
+        """Number of cells at each level 0-4"""
+        return np.bincount(self.levels.ravel(), minlength=MAX_LEVEL + 1)
@@ -1,13 +1,15 @@
 # preview_generator.py
 
 import logging
+import numpy as np
 from pathlib import Path
+from .pixel_grid import PixelGrid
 
 logger = logging.getLogger(__name__)
 
 class PreviewGenerator:
     def __init__(self, pixel_data):
-        self.pixel_data = pixel_data
+        self.pixel_data = PixelGrid.coerce(pixel_data)
         self.colors = {
             0: '⬜',  # 배경
             1: '🟩',  # 연한 녹색
@@ -16,14 +18,17 @@ class PreviewGenerator:
             4: '🟥',  # 가장 진한 강도
         }
 
+    def render(self):
+        """Render ASCII art preview as a string"""
+        # 레벨별 색상 조회표로 전체 그리드를 한 번에 변환
+        palette = np.array([self.colors.get(level, '⬜') for level in range(256)], dtype=object)
+        cells = palette[self.pixel_data.levels]
+        return ''.join(''.join(row) + '\n' for row in cells)
+
     def generate_preview(self, output_path):
         """Generate ASCII art preview and save to file"""
         try:
-            preview_str = ''
-            for row in self.pixel_data:
-                for cell in row:
-                    preview_str += self.colors.get(cell, '⬜')
-                preview_str += '\n'
+            preview_str = self.render()
             
             # Ensure output directory exists
             output_path = Path(output_path)
@@ -3,21 +3,24 @@
 import numpy as np
 from datetime import datetime, timedelta
 import logging
+from .pixel_grid import PixelGrid
 
 logger = logging.getLogger(__name__)
 
 class ScheduleGenerator:
-    def __init__(self, pixel_data):
-        self.pixel_data = pixel_data
-        # 현재 날짜로부터 52주 전으로 시작
-        self.start_date = datetime.now() - timedelta(weeks=52)
+    def __init__(self, pixel_data, start_date=None):
+        if start_date is None:
+            # 기본값: 그리드의 시작 날짜, 없으면 현재 날짜로부터 52주 전
+            start_date = getattr(pixel_data, 'start_date', None) or datetime.now() - timedelta(weeks=52)
+        self.pixel_data = PixelGrid.coerce(pixel_data, start_date)
+        self.start_date = self.pixel_data.start_date
         logger.info(f"Initialized ScheduleGenerator with start date: {self.start_date}")
 
     def get_date(self, week, day):
         """Calculate date for given week and day"""
         try:
             # week: 0-51 (52주), day: 0-6 (일-토)
-            target_date = self.start_date + timedelta(weeks=week, days=day)
+            target_date = self.start_date + timedelta(weeks=int(week), days=int(day))
             logger.debug(f"Generated date for week {week}, day {day}: {target_date}")
             return target_date
         except Exception as e:
@@ -30,20 +33,19 @@ class ScheduleGenerator:
             schedule = []
             logger.info("Generating commit schedule...")
             
-            for week in range(self.pixel_data.shape[1]):  # 52주
-                for day in range(self.pixel_data.shape[0]):  # 7일
-                    intensity = self.pixel_data[day, week]
-                    if intensity > 0:
-                        # Convert intensity levels (1-4) to number of commits
-                        num_commits = {
-                            1: 2,    # Light green: 2 commits
-                            2: 5,    # Medium green: 5 commits
-                            3: 8,    # Dark green: 8 commits
-                            4: 12,   # Darkest green: 12 commits
-                        }.get(intensity, 0)
-                        
-                        date = self.get_date(week, day)
-                        schedule.extend([date] * num_commits)
+            # Convert intensity levels (1-4) to number of commits
+            commits_per_level = np.zeros(256, dtype=np.int64)
+            commits_per_level[1] = 2    # Light green: 2 commits
+            commits_per_level[2] = 5    # Medium green: 5 commits
+            commits_per_level[3] = 8    # Dark green: 8 commits
+            commits_per_level[4] = 12   # Darkest green: 12 commits
+            
+            # 주 순서대로 커밋이 필요한 칸만 순회
+            weeks, days = self.pixel_data.nonzero_days()
+            num_commits = commits_per_level[self.pixel_data.levels[days, weeks]]
+            for week, day, count in zip(weeks, days, num_commits):
+                if count:
+                    schedule.extend([self.get_date(week, day)] * int(count))
             
             logger.info(f"Generated schedule with {len(schedule)} commits")
             return schedule
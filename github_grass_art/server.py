@@ -0,0 +1,373 @@
+# server.py
+
+import os
+import json
+import stat
+import time
+import ipaddress
+import logging
+import threading
+import socketserver
+import multiprocessing
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from .image_processor import ImageProcessor
+from .preview_generator import PreviewGenerator
+from .schedule_generator import ScheduleGenerator
+
+logger = logging.getLogger(__name__)
+
+STYLES = ('simple', 'gradient', 'border')
+MAX_BODY_SIZE = 64 * 1024
+
+
+def render(input_data, is_text=True, style='simple'):
+    """Render pixels, preview and schedule for one input/style"""
+    processor = ImageProcessor(input_data, is_text=is_text, style=style, as_grid=True)
+    pixels = processor.process_style(processor.load_image(), style)
+    scheduler = ScheduleGenerator(pixels)
+    schedule = scheduler.generate_schedule()
+    return {
+        'style': style,
+        'pixels': pixels.tolist(),
+        'preview': PreviewGenerator(pixels).render(),
+        'start_date': scheduler.start_date.strftime('%Y-%m-%d'),
+        'total_commits': len(schedule),
+        'schedule': [d.strftime('%Y-%m-%d %H:%M:%S') for d in schedule],
+    }
+
+
+def warm_up():
+    """Worker initializer: load PIL, fonts and scipy once per process"""
+    logging.getLogger('github_grass_art').setLevel(logging.WARNING)
+    for style in STYLES:
+        render('warm', style=style)
+
+
+def worker_ready(barrier):
+    """Startup task: block until every worker has run warm_up()"""
+    barrier.wait()
+    return os.getpid()
+
+
+class RenderCache:
+    """Thread-safe LRU cache of render futures keyed by input and style"""
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_submit(self, key, submit):
+        """Return cached future for key, or store and return a new one from submit()"""
+        with self._lock:
+            future = self._entries.get(key)
+            if future is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return future
+
+            # 진행 중인 동일 요청도 같은 future를 공유
+            self.misses += 1
+            future = submit()
+            self._entries[key] = future
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return future
+
+    def discard(self, key, future):
+        """Remove a failed future so the next request retries"""
+        with self._lock:
+            if self._entries.get(key) is future:
+                del self._entries[key]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+class LatencyMetrics:
+    """Per-route request latency tracker"""
+
+    def __init__(self, window=1024):
+        self.window = window
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def record(self, route, seconds, ok=True):
+        with self._lock:
+            entry = self._routes.setdefault(route, {
+                'count': 0,
+                'errors': 0,
+                'total': 0.0,
+                'samples': deque(maxlen=self.window),
+            })
+            entry['count'] += 1
+            entry['total'] += seconds
+            entry['samples'].append(seconds)
+            if not ok:
+                entry['errors'] += 1
+
+    def snapshot(self):
+        """Latency summary in milliseconds per route"""
+        with self._lock:
+            routes = {
+                route: (entry['count'], entry['errors'], entry['total'], sorted(entry['samples']))
+                for route, entry in self._routes.items()
+            }
+
+        result = {}
+        for route, (count, errors, total, samples) in routes.items():
+            def percentile(p):
+                return samples[min(len(samples) - 1, int(p * len(samples)))] * 1000
+
+            result[route] = {
+                'count': count,
+                'errors': errors,
+                'mean_ms': total / count * 1000,
+                'p50_ms': percentile(0.50),
+                'p95_ms': percentile(0.95),
+                'p99_ms': percentile(0.99),
+                'max_ms': samples[-1] * 1000,
+            }
+        return result
+
+
+class RenderService:
+    """Keeps the rendering pipeline warm and serves results from a worker pool
+
+    Renders run in worker processes so they execute in parallel despite the
+    GIL; each worker preloads the imaging stack once in warm_up().
+    """
+
+    def __init__(self, workers=None, cache_size=256, timeout=30, allow_images=False):
+        """
+        Initialize RenderService
+
+        Args:
+            workers: 렌더링 워커 수 (기본값: CPU 수)
+            cache_size: LRU 캐시 최대 항목 수
+            timeout: 요청당 렌더링 대기 시간 (초)
+            allow_images: 서버 측 이미지 경로 입력 허용 여부
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.allow_images = allow_images
+        self.timeout = timeout
+        # fork은 HTTP 서버 스레드와 함께 쓰기 안전하지 않으므로 spawn 사용
+        self.mp_context = multiprocessing.get_context('spawn')
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self.mp_context,
+            initializer=warm_up,
+        )
+        self.start_workers()
+        self.cache = RenderCache(cache_size)
+        self.metrics = LatencyMetrics()
+        logger.info(f"Initialized RenderService with {self.workers} workers, cache size {cache_size}")
+
+    def start_workers(self):
+        """Spawn and warm every worker now; the pool otherwise starts them lazily"""
+        start = time.perf_counter()
+        # 배리어로 작업이 워커마다 하나씩 실행되게 하여 모든 워커가 준비될 때까지 대기
+        with self.mp_context.Manager() as manager:
+            barrier = manager.Barrier(self.workers)
+            futures = [self.pool.submit(worker_ready, barrier) for _ in range(self.workers)]
+            pids = {future.result(timeout=self.timeout) for future in futures}
+        logger.info(f"Started {len(pids)} warm workers in {time.perf_counter() - start:.2f}s")
+
+    def cache_key(self, input_data, is_text, style):
+        """Build cache key; image inputs include mtime so edited files are re-rendered"""
+        if is_text:
+            source = ('text', input_data)
+        else:
+            path = Path(input_data)
+            source = ('image', str(path.resolve()), path.stat().st_mtime_ns)
+        # 스케줄은 오늘 날짜 기준이므로 날짜가 바뀌면 다시 계산
+        return source + (style, date.today().isoformat())
+
+    def get(self, input_data, is_text=True, style='simple'):
+        """Return a cached render, computing it on the worker pool on a miss"""
+        if style not in STYLES:
+            raise ValueError(f"Unknown style: {style}")
+        if not is_text and not self.allow_images:
+            # 클라이언트가 서버의 임의 파일을 열거나 존재 여부를 확인하지 못하도록 차단
+            raise PermissionError("Image inputs are disabled; start the server with --allow-images")
+
+        key = self.cache_key(input_data, is_text, style)
+        future = self.cache.get_or_submit(
+            key, lambda: self.pool.submit(render, input_data, is_text, style)
+        )
+        try:
+            return future.result(timeout=self.timeout)
+        except Exception:
+            self.cache.discard(key, future)
+            raise
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for RenderService
+
+    GET  /health   - 상태 확인
+    GET  /metrics  - 요청 지연 시간 및 캐시 통계
+    POST /render   - {"input": ..., "is_text": true, "style": "simple", "format": "json" | "preview"}
+    """
+
+    server_version = 'GitHubGrassArt'
+
+    def address_string(self):
+        # Unix 소켓에는 (host, port) 주소가 없음
+        if isinstance(self.client_address, tuple):
+            return self.client_address[0]
+        return 'unix'
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def send_body(self, status, body, content_type):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_json(self, status, payload):
+        self.send_body(status, json.dumps(payload, ensure_ascii=False), 'application/json; charset=utf-8')
+
+    def handle_timed(self, route, handler):
+        service = self.server.service
+        start = time.perf_counter()
+        ok = False
+        try:
+            handler()
+            ok = True
+        except PermissionError as e:
+            self.send_json(403, {'error': str(e)})
+        except (ValueError, FileNotFoundError) as e:
+            self.send_json(400, {'error': str(e)})
+        except Exception as e:
+            logger.error(f"Error handling {route}: {e}")
+            self.send_json(500, {'error': str(e)})
+        finally:
+            service.metrics.record(route, time.perf_counter() - start, ok)
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == '/health':
+            self.send_json(200, {'status': 'ok'})
+        elif self.path == '/metrics':
+            self.send_json(200, {
+                'latency': service.metrics.snapshot(),
+                'cache': service.cache.stats(),
+                'workers': service.workers,
+            })
+        else:
+            self.send_json(404, {'error': f"Not found: {self.path}"})
+
+    def do_POST(self):
+        if self.path != '/render':
+            self.send_json(404, {'error': f"Not found: {self.path}"})
+            return
+        self.handle_timed('/render', self.handle_render)
+
+    def handle_render(self):
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            raise ValueError("Invalid Content-Length")
+        # 음수 길이는 rfile.read가 연결 종료까지 블록되므로 본문을 읽기 전에 거부
+        if not 0 <= length <= MAX_BODY_SIZE:
+            raise ValueError(f"Content-Length must be between 0 and {MAX_BODY_SIZE}")
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+
+        if not isinstance(request, dict):
+            raise ValueError("Request body must be a JSON object")
+        if not isinstance(request.get('input'), str):
+            raise ValueError("'input' must be a string")
+        is_text = request.get('is_text', True)
+        if not isinstance(is_text, bool):
+            raise ValueError("'is_text' must be a boolean")
+        style = request.get('style', 'simple')
+        output_format = request.get('format', 'json')
+        if not isinstance(style, str) or not isinstance(output_format, str):
+            raise ValueError("'style' and 'format' must be strings")
+        if output_format not in ('json', 'preview'):
+            raise ValueError(f"Unknown format: {output_format}")
+
+        result = self.server.service.get(request['input'], is_text=is_text, style=style)
+
+        if output_format == 'preview':
+            self.send_body(200, result['preview'], 'text/plain; charset=utf-8')
+        else:
+            self.send_json(200, result)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def is_loopback(host):
+    """Check whether host is a loopback address"""
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def remove_socket(socket_path):
+    """Remove a leftover Unix socket, refusing to delete any other kind of file"""
+    try:
+        mode = socket_path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"Refusing to replace non-socket file: {socket_path}")
+    socket_path.unlink()
+
+
+def run_server(host='127.0.0.1', port=8765, socket_path=None, workers=None, cache_size=256,
+               allow_images=False, allow_remote=False):
+    """Run the render service over TCP or a Unix socket until interrupted"""
+    if socket_path:
+        socket_path = Path(socket_path)
+        remove_socket(socket_path)
+        httpd = ThreadingUnixHTTPServer(str(socket_path), RenderRequestHandler)
+        address = f"unix:{socket_path}"
+    else:
+        if not is_loopback(host) and not allow_remote:
+            raise ValueError(f"Refusing to bind non-loopback host {host}; pass --allow-remote to override")
+        httpd = ThreadingHTTPServer((host, port), RenderRequestHandler)
+        address = f"http://{host}:{port}"
+    service = RenderService(workers=workers, cache_size=cache_size, allow_images=allow_images)
+    httpd.service = service
+
+    logger.info(f"Render service listening on {address}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down render service")
+    finally:
+        httpd.server_close()
+        service.shutdown()
+        if socket_path:
+            remove_socket(socket_path)
+    return 0